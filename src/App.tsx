@@ -63,6 +63,65 @@ const useVirtualScroll = (items: any[], itemHeight: number, containerHeight: num
   };
 };
 
+// Characters that must be escaped before a search term is used as a pattern
+const REGEX_SPECIAL_CHARS = /[.*+?^${}()|[\]\\]/g;
+
+const categories = [
+  { id: 'films', name: '最佳電影', data: filmsData, count: filmsData.length },
+  { id: 'songs', name: '最佳原創電影歌曲', data: songsData, count: songsData.length },
+  { id: 'ads', name: '最佳廣告片', data: adsData, count: adsData.length },
+  { id: 'audition-films', name: '最佳試音片', data: auditionFilmsData, count: auditionFilmsData.length },
+  { id: 'variety-shows', name: '最佳綜藝', data: varietyShowsData, count: varietyShowsData.length },
+  { id: 'supporting-actors', name: '最佳搭膊頭', data: supportingActorsData, count: supportingActorsData.length },
+];
+
+// Fields matched by the search box, extracted once per item
+const getSearchFields = (categoryId: string, item: any): string[] => {
+  if (categoryId === 'supporting-actors') {
+    return [item];
+  }
+
+  if (categoryId === 'films') {
+    return [
+      item.title,
+      item.fullTitle,
+      item.director,
+      item.writer,
+      item.leadActor,
+      item.leadActress,
+      item.supportingActor,
+      item.supportingActress,
+      item.newActor,
+      item.editor,
+      item.cinematographer,
+      item.actionDesign,
+      item.artDirector,
+      item.visualEffects,
+      item.month
+    ].filter(Boolean);
+  }
+
+  return [
+    item.title || item.song || item.name,
+    item.fullTitle,
+    item.movie,
+    item.director
+  ].filter(Boolean);
+};
+
+// Built once at module load so currentCategory keeps a stable identity across renders
+const categoriesById = Object.fromEntries(categories.map(cat => [cat.id, cat]));
+
+// Lowercased search text aligned by index with each category's data array.
+// Fields are joined with a newline, which the search input cannot contain,
+// so a term can never match across two fields.
+const searchTextById: Record<string, string[]> = Object.fromEntries(
+  categories.map(cat => [
+    cat.id,
+    (cat.data as any[]).map(item => getSearchFields(cat.id, item).join('\n').toLowerCase())
+  ])
+);
+
 const App: React.FC = () => {
   const [selectedCategory, setSelectedCategory] = useState<string>('films');
   const [searchTerm, setSearchTerm] = useState<string>('');
@@ -79,21 +138,27 @@ const App: React.FC = () => {
   // Debounce search term to improve performance
   const debouncedSearchTerm = useDebounce(searchTerm, 300);
 
+  // Compile the highlight pattern once per search term instead of per field
+  const highlightRegex = useMemo(() => {
+    if (!debouncedSearchTerm.trim()) return null;
+    return new RegExp(`(${debouncedSearchTerm.replace(REGEX_SPECIAL_CHARS, '\\$&')})`, 'i');
+  }, [debouncedSearchTerm]);
+
   // Helper function to highlight searched text
-  const highlightText = useCallback((text: string, searchTerm: string) => {
-    if (!searchTerm.trim()) return text;
+  const highlightText = useCallback((text: string) => {
+    if (!highlightRegex) return text;
     
-    const regex = new RegExp(`(${searchTerm.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')})`, 'gi');
-    const parts = text.split(regex);
+    const parts = text.split(highlightRegex);
     
+    // split() with a capturing group puts the matches at odd indices
     return parts.map((part, index) => 
-      regex.test(part) ? (
+      index % 2 === 1 ? (
         <mark key={index} className="highlighted-text">{part}</mark>
       ) : (
         part
       )
     );
-  }, []);
+  }, [highlightRegex]);
 
   // Load watched items from localStorage on component mount
   useEffect(() => {
@@ -151,60 +216,23 @@ const App: React.FC = () => {
     });
   }, []);
 
-  const categories = [
-    { id: 'films', name: '最佳電影', data: filmsData, count: filmsData.length },
-    { id: 'songs', name: '最佳原創電影歌曲', data: songsData, count: songsData.length },
-    { id: 'ads', name: '最佳廣告片', data: adsData, count: adsData.length },
-    { id: 'audition-films', name: '最佳試音片', data: auditionFilmsData, count: auditionFilmsData.length },
-    { id: 'variety-shows', name: '最佳綜藝', data: varietyShowsData, count: varietyShowsData.length },
-    { id: 'supporting-actors', name: '最佳搭膊頭', data: supportingActorsData, count: supportingActorsData.length },
-  ];
-
-  const currentCategory = categories.find(cat => cat.id === selectedCategory);
+  const currentCategory = categoriesById[selectedCategory];
   
   // Memoize filtered data to prevent unnecessary re-computations
   const filteredData = useMemo(() => {
     if (!currentCategory) return [];
     
-    return currentCategory.data.filter((item: any) => {
-      if (selectedCategory === 'supporting-actors') {
-        return item.toLowerCase().includes(debouncedSearchTerm.toLowerCase());
-      }
-      
-      if (selectedCategory === 'films') {
-        const searchFields = [
-          item.title,
-          item.fullTitle,
-          item.director,
-          item.writer,
-          item.leadActor,
-          item.leadActress,
-          item.supportingActor,
-          item.supportingActress,
-          item.newActor,
-          item.editor,
-          item.cinematographer,
-          item.actionDesign,
-          item.artDirector,
-          item.visualEffects,
-          item.month
-        ].filter(Boolean);
-        return searchFields.some(field => 
-          field.toLowerCase().includes(debouncedSearchTerm.toLowerCase())
-        );
-      }
-      
-      const searchFields = [
-        item.title || item.song || item.name,
-        item.fullTitle,
-        item.movie,
-        item.director
-      ].filter(Boolean);
-      return searchFields.some(field => 
-        field.toLowerCase().includes(debouncedSearchTerm.toLowerCase())
-      );
-    });
-  }, [currentCategory, selectedCategory, debouncedSearchTerm]);
+    // An empty term matches everything; skip the per-item scan
+    if (!debouncedSearchTerm) return currentCategory.data;
+    
+    const normalizedSearchTerm = debouncedSearchTerm.toLowerCase();
+    
+    const searchText = searchTextById[currentCategory.id];
+    
+    return currentCategory.data.filter((_: any, index: number) => 
+      searchText[index].includes(normalizedSearchTerm)
+    );
+  }, [currentCategory, debouncedSearchTerm]);
 
   // Handle loading state for search
   useEffect(() => {
@@ -266,9 +294,9 @@ const App: React.FC = () => {
     const isWatched = watchedItems.films.has(filmId);
     
     return (
-      <div key={`${item.title}-${item.director || ''}`} className="nominee-card film-card">
+      <div key={filmId} className="nominee-card film-card">
         <div className="nominee-title">
-          <div className="nominee-title-text">{highlightText(item.title, debouncedSearchTerm)}</div>
+          <div className="nominee-title-text">{highlightText(item.title)}</div>
           <div className="watched-checkbox" onClick={() => toggleWatched(filmId, 'films')}>
             <span className={`checkbox ${isWatched ? 'checked' : ''}`}>
               {isWatched ? '✓' : ''}
@@ -279,110 +307,106 @@ const App: React.FC = () => {
         {item.fullTitle && item.fullTitle !== item.title && (
           <div className="nominee-subtitle" onClick={() => handleYouTubeLink(item)}>
             <img src={youtubeIcon} alt="YouTube" className="youtube-icon" />
-            {highlightText(item.fullTitle, debouncedSearchTerm)}
+            {highlightText(item.fullTitle)}
           </div>
         )}
         <div className="film-meta">
           {item.director && (
             <div className="film-detail">
               <span className="detail-label">導演：</span>
-              <span className="detail-value">{highlightText(item.director, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.director)}</span>
             </div>
           )}
           {item.writer && (
             <div className="film-detail">
               <span className="detail-label">編劇：</span>
-              <span className="detail-value">{highlightText(item.writer, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.writer)}</span>
             </div>
           )}
           {item.leadActor && (
             <div className="film-detail">
               <span className="detail-label">男主角：</span>
-              <span className="detail-value">{highlightText(item.leadActor, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.leadActor)}</span>
             </div>
           )}
           {item.leadActress && (
             <div className="film-detail">
               <span className="detail-label">女主角：</span>
-              <span className="detail-value">{highlightText(item.leadActress, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.leadActress)}</span>
             </div>
           )}
           {item.supportingActor && (
             <div className="film-detail">
               <span className="detail-label">男配角：</span>
-              <span className="detail-value">{highlightText(item.supportingActor, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.supportingActor)}</span>
             </div>
           )}
           {item.supportingActress && (
             <div className="film-detail">
               <span className="detail-label">女配角：</span>
-              <span className="detail-value">{highlightText(item.supportingActress, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.supportingActress)}</span>
             </div>
           )}
           {item.newActor && (
             <div className="film-detail">
               <span className="detail-label">新演員：</span>
-              <span className="detail-value">{highlightText(item.newActor, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.newActor)}</span>
             </div>
           )}
           {item.editor && (
             <div className="film-detail">
               <span className="detail-label">剪接：</span>
-              <span className="detail-value">{highlightText(item.editor, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.editor)}</span>
             </div>
           )}
           {item.cinematographer && (
             <div className="film-detail">
               <span className="detail-label">攝影：</span>
-              <span className="detail-value">{highlightText(item.cinematographer, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.cinematographer)}</span>
             </div>
           )}
           {item.actionDesign && (
             <div className="film-detail">
               <span className="detail-label">動作設計：</span>
-              <span className="detail-value">{highlightText(item.actionDesign, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.actionDesign)}</span>
             </div>
           )}
           {item.artDirector && (
             <div className="film-detail">
               <span className="detail-label">美術指導：</span>
-              <span className="detail-value">{highlightText(item.artDirector, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.artDirector)}</span>
             </div>
           )}
           {item.visualEffects && (
             <div className="film-detail">
               <span className="detail-label">視覺效果：</span>
-              <span className="detail-value">{highlightText(item.visualEffects, debouncedSearchTerm)}</span>
+              <span className="detail-value">{highlightText(item.visualEffects)}</span>
             </div>
           )}
         </div>
         <div className="nominee-date">{item.releaseDate}</div>
       </div>
     );
-  }, [highlightText, debouncedSearchTerm, watchedItems.films, toggleWatched, handleYouTubeLink]);
+  }, [highlightText, watchedItems.films, toggleWatched, handleYouTubeLink]);
 
   const renderNomineeCard = useCallback((item: any, index: number) => {
     if (selectedCategory === 'supporting-actors') {
       return (
         <div key={index} className="nominee-card">
           <div className="nominee-title">
-            <div className="nominee-title-text">{highlightText(item, debouncedSearchTerm)}</div>
+            <div className="nominee-title-text">{highlightText(item)}</div>
           </div>
         </div>
       );
     }
 
-    if (selectedCategory === 'films') {
-      return renderFilmCard(item);
-    }
-
     const itemId = `${item.song || item.title || item.name}-${item.movie || item.director || ''}`;
     const isWatched = watchedItems[selectedCategory].has(itemId);
 
     return (
       <div key={item.id || index} className="nominee-card">
         <div className="nominee-title">
-          <div className="nominee-title-text">{highlightText(item.song || item.title, debouncedSearchTerm)}</div>
+          <div className="nominee-title-text">{highlightText(item.song || item.title)}</div>
           <div className="watched-checkbox" onClick={() => toggleWatched(itemId, selectedCategory)}>
             <span className={`checkbox ${isWatched ? 'checked' : ''}`}>
               {isWatched ? '✓' : ''}
@@ -393,19 +417,19 @@ const App: React.FC = () => {
         {item.fullTitle && item.fullTitle !== item.title && (
           <div className="nominee-subtitle" onClick={() => handleYouTubeLink(item)}>
             <img src={youtubeIcon} alt="YouTube" className="youtube-icon" />
-            {highlightText(item.fullTitle, debouncedSearchTerm)}
+            {highlightText(item.fullTitle)}
           </div>
         )}
         {item.movie && (
-          <div className="nominee-movie">{highlightText(item.movie, debouncedSearchTerm)}</div>
+          <div className="nominee-movie">{highlightText(item.movie)}</div>
         )}
         {item.director && (
-          <div className="nominee-director">導演：{highlightText(item.director, debouncedSearchTerm)}</div>
+          <div className="nominee-director">導演：{highlightText(item.director)}</div>
         )}
         <div className="nominee-date">{item.releaseDate}</div>
       </div>
     );
-  }, [selectedCategory, highlightText, debouncedSearchTerm, watchedItems, toggleWatched, renderFilmCard, handleYouTubeLink]);
+  }, [selectedCategory, highlightText, watchedItems, toggleWatched, handleYouTubeLink]);
 
   return (
     <div className="app">
@@ -486,7 +510,7 @@ const App: React.FC = () => {
             )}
           </div>
         ) : (
-          <div className={`nominees-grid ${selectedCategory === 'films' ? 'films-grid' : ''}`}>
+          <div className="nominees-grid">
             {filteredData.map((item, index) => renderNomineeCard(item, index))}
           </div>
         )}